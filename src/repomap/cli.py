@@ -88,8 +88,7 @@ def main(argv: Iterable[str] | None = None) -> int:
         return 0
 
     report = generate_repo_report(root, exclude_set, gitignore_rules)
-    lines = render_repo_map(report, exclude_set)
-    output_text = "\n".join(lines).rstrip()
+    output_text = render_repo_map(report, exclude_set).rstrip()
 
     if args.dry_run or args.output == "-":
         print(output_text)
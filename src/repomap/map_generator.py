@@ -1,17 +1,59 @@
 """Core helpers for assembling a repository map."""
 
-import ast
+import io
+import os
 import re
+import tokenize
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 import pathspec
 
 URL_PATTERN = re.compile(r"https?://[\w\-./?&=%+#,;:~$@!]+")
-HTTP_LIBS = {"requests", "httpx", "aiohttp"}
+# Pre-bound method: skips the attribute lookup on every scanned string.
+_url_finditer = URL_PATTERN.finditer
+HTTP_LIBS = frozenset({"requests", "httpx", "aiohttp"})
 DEFAULT_EXCLUDE = {".git", ".venv", "__pycache__", ".idea"}
 _GITIGNORE_META = {"*", "?", "["}
+# Below this many files the process-pool startup cost outweighs the win.
+_PARALLEL_MIN_FILES = 50
+_PARALLEL_CHUNKSIZE = 32
+# Token kinds the scanner dispatches on; ints, so plain == compares.
+_NAME = tokenize.NAME
+_OP = tokenize.OP
+_STRING = tokenize.STRING
+# New in 3.12; before that f-string literals tokenize as plain STRINGs.
+_FSTRING_MIDDLE = getattr(tokenize, "FSTRING_MIDDLE", -1)
+_STMT_BOUNDARY = frozenset({tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT})
+_IGNORED_TOKENS = frozenset({tokenize.NL, tokenize.COMMENT, tokenize.ENCODING})
+
+
+def _is_bytes_literal(text: str) -> bool:
+    """Report whether a STRING token's prefix marks a bytes literal."""
+    for char in text:
+        if char in "\"'":
+            return False
+        if char in "bB":
+            return True
+    return False
+
+
+def _parse_simple_excludes(lines: Iterable[str]) -> Set[str]:
+    """Extract literal top-level directory names from .gitignore lines."""
+    excludes: Set[str] = set()
+    for line in lines:
+        entry = line.strip()
+        if not entry or entry.startswith("#") or entry.startswith("!"):
+            continue
+        first = entry.split("/", 1)[0]
+        if not first or any(char in first for char in _GITIGNORE_META):
+            continue
+        excludes.add(first.rstrip("/"))
+    return excludes
 
 
 class GitignoreRules:
@@ -19,21 +61,26 @@ class GitignoreRules:
 
     def __init__(self, root: Path):
         self.root = root
+        # Literal top-level names from the root .gitignore, harvested from
+        # the same read that builds its pathspec.
+        self.root_excludes: Set[str] = set()
         self._specs: Dict[Path, pathspec.PathSpec] = {}
+        self._flat_rules: List[Tuple[str, int, List, Optional[re.Pattern]]] = []
+        # Verdicts cached per directory, then basename: one small dict per
+        # directory keeps keys short and lets siblings share the outer hit.
+        self._cache: Dict[str, Dict[str, bool]] = {}
         self._load_all_gitignores()
+        self._flatten_rules()
 
     def _load_all_gitignores(self) -> None:
         """Load all .gitignore files recursively from root."""
-        # Load root .gitignore first
-        root_gitignore = self.root / ".gitignore"
-        if root_gitignore.exists():
-            self._load_gitignore(self.root)
-
-        # Load all subdirectory .gitignore files
-        for gitignore_path in self.root.rglob(".gitignore"):
-            if gitignore_path != root_gitignore:
-                dir_path = gitignore_path.parent
-                self._load_gitignore(dir_path)
+        # os.walk visits the root first and yields each directory's file
+        # list in one scandir pass, so no per-directory exists() probes are
+        # needed; excluded trees such as .git/.venv are pruned outright.
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [name for name in dirnames if name not in DEFAULT_EXCLUDE]
+            if ".gitignore" in filenames:
+                self._load_gitignore(Path(dirpath))
 
     def _load_gitignore(self, directory: Path) -> None:
         """Load .gitignore from a specific directory."""
@@ -45,6 +92,35 @@ class GitignoreRules:
         # pathspec expects lines without trailing newlines
         spec = pathspec.PathSpec.from_lines("gitignore", lines)
         self._specs[directory] = spec
+        if directory == self.root:
+            self.root_excludes = _parse_simple_excludes(lines)
+
+    def _flatten_rules(self) -> None:
+        """Precompute per-.gitignore (prefix, prefix length, patterns) tuples.
+
+        Flattening once up front means `is_ignored_str` only does string
+        prefix checks per lookup instead of rebuilding `Path` objects for
+        every ancestor directory.
+        """
+        entries: List[Tuple[str, int, List, Optional[re.Pattern]]] = []
+        for directory, spec in self._specs.items():
+            if directory == self.root:
+                prefix = ""
+            else:
+                rel = str(directory.relative_to(self.root)).replace("\\", "/")
+                prefix = rel + "/"
+            patterns = [p for p in spec.patterns if p.regex is not None]
+            # Without negations, "last match wins" degenerates to "any
+            # match ignores", so the whole file collapses into one
+            # alternation the regex engine evaluates in a single pass.
+            combined: Optional[re.Pattern] = None
+            if patterns and all(p.include for p in patterns):
+                combined = re.compile("|".join(p.regex.pattern for p in patterns))
+            entries.append((prefix, len(prefix), patterns, combined))
+        # Outer .gitignore files apply before inner ones (last match wins),
+        # and along any one path the applicable prefixes strictly lengthen.
+        entries.sort(key=lambda item: item[1])
+        self._flat_rules = entries
 
     def is_ignored(self, file_path: Path) -> bool:
         """Check if a file is ignored by any applicable .gitignore rule."""
@@ -53,50 +129,40 @@ class GitignoreRules:
             rel_path = file_path.relative_to(self.root)
         except ValueError:
             return False
+        return self.is_ignored_str(str(rel_path))
+
+    def is_ignored_str(self, rel_path_str: str) -> bool:
+        """Check a root-relative path string against all applicable rules."""
+        # pathspec expects forward slashes
+        rel_path_str = rel_path_str.replace("\\", "/")
+        directory, _, basename = rel_path_str.rpartition("/")
+        dir_cache = self._cache.get(directory)
+        if dir_cache is None:
+            dir_cache = self._cache[directory] = {}
+        else:
+            cached = dir_cache.get(basename)
+            if cached is not None:
+                return cached
 
-        # Convert to string with forward slashes for pathspec
-        rel_path_str = str(rel_path).replace("\\", "/")
-
-        # Collect all applicable .gitignore directories from root to file's parent
-        applicable_dirs: List[Path] = []
-
-        # Check root first
-        if self.root in self._specs:
-            applicable_dirs.append(self.root)
-
-        # Check intermediate directories and file's parent
-        current_dir = self.root
-        for part in rel_path.parts[:-1]:  # Exclude the filename itself
-            current_dir = current_dir / part
-            if current_dir in self._specs:
-                applicable_dirs.append(current_dir)
-
-        # Collect all patterns from all applicable .gitignore files in order
-        all_patterns = []
-        for gitignore_dir in applicable_dirs:
-            spec = self._specs[gitignore_dir]
-            for pattern in spec.patterns:
-                all_patterns.append((gitignore_dir, pattern))
-
-        # Apply patterns in order
+        # Apply patterns in order using the flattened rule list.
         # Last match wins (negation can override previous matches)
         ignored = False
-        for gitignore_dir, pattern in all_patterns:
-            # Calculate relative path from this .gitignore's directory
-            try:
-                path_from_gitignore = file_path.relative_to(gitignore_dir)
-                path_str = str(path_from_gitignore).replace("\\", "/")
-            except ValueError:
+        for prefix, prefix_len, patterns, combined in self._flat_rules:
+            if prefix and not rel_path_str.startswith(prefix):
                 continue
-
-            # Check if pattern matches
-            if pattern.match_file(path_str):
-                # Negation pattern (starts with !) un-ignores
-                if pattern.pattern.startswith("!"):
-                    ignored = False
-                else:
+            path_str = rel_path_str[prefix_len:]
+            if combined is not None:
+                # Negation-free fast path: a single combined-regex probe
+                # can only ever flip the verdict to ignored.
+                if not ignored and combined.search(path_str):
                     ignored = True
+                continue
+            for pattern in patterns:
+                if pattern.match_file(path_str):
+                    # Negation pattern (include is False) un-ignores
+                    ignored = bool(pattern.include)
 
+        dir_cache[basename] = ignored
         return ignored
 
 
@@ -105,11 +171,18 @@ class RepoMapReport:
     """Structured data captured for repo_map.md."""
 
     top_dirs: List[str]
-    imports_by_dir: Dict[str, Set[str]]
+    imports_by_dir: Dict[str, List[str]]
     http_usage: Dict[str, List[str]]
     url_report: Dict[str, List[Tuple[int, str]]]
 
 
+def _insort_unique(items: List[str], value: str) -> None:
+    """Insert `value` into sorted `items` unless it is already present."""
+    index = bisect_left(items, value)
+    if index == len(items) or items[index] != value:
+        items.insert(index, value)
+
+
 def gather_top_level_dirs(root: Path, exclude: Set[str]) -> List[str]:
     """Return alphabetical top-level directories not filtered by `exclude`."""
     dirs = []
@@ -122,92 +195,220 @@ def gather_top_level_dirs(root: Path, exclude: Set[str]) -> List[str]:
 
 def collect_file_imports(path: Path) -> Tuple[Set[str], Set[str]]:
     """Return imports and detected HTTP clients from a Python module."""
-    imports = set()
-    http_used = set()
-    try:
-        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    except (UnicodeDecodeError, SyntaxError):
-        return imports, http_used
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                root_name = alias.name.split(".", 1)[0]
-                imports.add(root_name)
-                if root_name in HTTP_LIBS:
-                    http_used.add(root_name)
-        elif isinstance(node, ast.ImportFrom):
-            module = node.module
-            if module:
-                root_name = module.split(".", 1)[0]
-                imports.add(root_name)
-                if root_name in HTTP_LIBS:
-                    http_used.add(root_name)
+    imports, http_used, _ = collect_file_facts(path)
     return imports, http_used
 
 
 def collect_urls(path: Path) -> List[Tuple[int, str]]:
     """Gather literal URLs defined in a Python module."""
-    urls = []
-    try:
-        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    except (UnicodeDecodeError, SyntaxError):
-        return urls
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Constant) and isinstance(node.value, str):
-            for match in URL_PATTERN.finditer(node.value):
-                lineno = getattr(node, "lineno", None)
-                urls.append((lineno or 0, match.group()))
+    _, _, urls = collect_file_facts(path)
     return urls
 
 
+def collect_file_facts(
+    path: Path,
+) -> Tuple[Set[str], Set[str], List[Tuple[int, str]]]:
+    """Scan a module once and collect imports, HTTP clients, and URLs.
+
+    The scan runs over the token stream instead of an AST: tokenizing is
+    far cheaper than building a full parse tree, import roots fall out of
+    the first NAME token after `import`/`from` (dots are separate OP
+    tokens, so no splitting is needed), and URL literals come from STRING
+    and f-string tokens. Known deviation from the old AST pass: URLs
+    split across implicitly concatenated string literals are reported as
+    their individual pieces, not the joined value. The function is
+    module-level so it can be shipped to worker processes.
+    """
+    imports: Set[str] = set()
+    http_used: Set[str] = set()
+    urls: List[Tuple[int, str]] = []
+    try:
+        source = path.read_bytes()
+    except OSError:
+        return imports, http_used, urls
+    # A module whose raw bytes never contain "http" cannot yield a URL
+    # literal, so string tokens can be skipped wholesale.
+    scan_urls = b"http" in source
+    mode = None  # None, "import", or "from"
+    expect_name = False
+    at_stmt_start = True
+    try:
+        for tok in tokenize.tokenize(io.BytesIO(source).readline):
+            tok_type = tok.type
+            if tok_type == _NAME:
+                text = tok.string
+                if mode == "import":
+                    # Record the first NAME after `import` or a comma;
+                    # `.submodule` and `as alias` parts stay ignored.
+                    if expect_name:
+                        imports.add(text)
+                        if text in HTTP_LIBS:
+                            http_used.add(text)
+                        expect_name = False
+                elif mode == "from":
+                    # First NAME is the module root unless the statement
+                    # is a bare relative import (`from . import x`).
+                    if text != "import":
+                        imports.add(text)
+                        if text in HTTP_LIBS:
+                            http_used.add(text)
+                    mode = None
+                elif at_stmt_start:
+                    if text == "import":
+                        mode = "import"
+                        expect_name = True
+                    elif text == "from":
+                        mode = "from"
+                at_stmt_start = False
+            elif tok_type == _OP:
+                text = tok.string
+                if text == ";" or text == ":":
+                    # Semicolons separate statements; a colon opens the
+                    # suite of a single-line compound statement such as
+                    # `if True: import foo`. In other colon positions
+                    # (dicts, slices, annotations, lambdas) the following
+                    # expression can never begin with import/from, so
+                    # arming the statement flag there is harmless.
+                    at_stmt_start = True
+                    mode = None
+                else:
+                    if text == "," and mode == "import":
+                        expect_name = True
+                    at_stmt_start = False
+            elif tok_type == _STRING:
+                text = tok.string
+                if scan_urls and "http" in text and not _is_bytes_literal(text):
+                    for match in _url_finditer(text):
+                        urls.append((tok.start[0], match.group()))
+                at_stmt_start = False
+            elif tok_type == _FSTRING_MIDDLE:
+                text = tok.string
+                if scan_urls and "http" in text:
+                    for match in _url_finditer(text):
+                        urls.append((tok.start[0], match.group()))
+                at_stmt_start = False
+            elif tok_type in _STMT_BOUNDARY:
+                at_stmt_start = True
+                mode = None
+            elif tok_type not in _IGNORED_TOKENS:
+                at_stmt_start = False
+    except (tokenize.TokenError, IndentationError, SyntaxError, UnicodeDecodeError):
+        # Keep whatever was gathered before the stream broke.
+        pass
+    return imports, http_used, urls
+
+
+def _parse_files(
+    python_files: List[Path],
+) -> List[Tuple[Set[str], Set[str], List[Tuple[int, str]]]]:
+    """Parse all files, fanning out across cores when there are enough."""
+    if len(python_files) < _PARALLEL_MIN_FILES:
+        return [collect_file_facts(path) for path in python_files]
+    with ProcessPoolExecutor() as executor:
+        return list(
+            executor.map(
+                collect_file_facts, python_files, chunksize=_PARALLEL_CHUNKSIZE
+            )
+        )
+
+
+def _root_prefix(root: Path) -> str:
+    """Return the prefix shared by every scanned path under `root`.
+
+    `Path` drops a leading `./`, so for the cwd root the scanned paths
+    carry no prefix at all; slicing with `str(root) + sep` there would
+    chop real characters off every relative path.
+    """
+    root_str = str(root)
+    return "" if root_str == "." else os.path.join(root_str, "")
+
+
+def _relative_str(path_str: str, root: Path, prefix: str) -> str:
+    """Take the root-relative form of `path_str` with a single slice."""
+    if path_str.startswith(prefix):
+        return path_str[len(prefix) :]
+    # Paths supplied by callers rather than the scanner may spell the
+    # root differently; fall back to a full relpath computation.
+    return os.path.relpath(path_str, str(root))
+
+
 def aggregate_imports(
     root: Path, python_files: Iterable[Path]
-) -> Tuple[Dict[str, Set[str]], Dict[str, List[str]]]:
+) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
     """Group imports and HTTP usage by directory relative to `root`."""
-    dir_imports: Dict[str, Set[str]] = {}
+    dir_imports: Dict[str, List[str]] = {}
     http_usage: Dict[str, List[str]] = {lib: [] for lib in HTTP_LIBS}
+    # All paths share the root prefix, so relative paths are a single
+    # string slice instead of a Path.relative_to call per file.
+    prefix = _root_prefix(root)
     for path in python_files:
-        rel_dir = path.parent.relative_to(root)
-        key = str(rel_dir) if str(rel_dir) != "." else "."
-        imports, http_libs = collect_file_imports(path)
+        rel_str = _relative_str(str(path), root, prefix)
+        key = rel_str.rpartition(os.sep)[0] or "."
+        imports, http_libs, _ = collect_file_facts(path)
         if not imports:
             continue
-        dir_imports.setdefault(key, set()).update(sorted(imports))
+        bucket = dir_imports.setdefault(key, [])
+        for name in imports:
+            _insort_unique(bucket, name)
         for lib in http_libs:
-            http_usage.setdefault(lib, []).append(str(path.relative_to(root)))
+            _insort_unique(http_usage.setdefault(lib, []), rel_str)
     return dir_imports, http_usage
 
 
+def _scandir_py(
+    root: Path, exclude: Set[str], gitignore_rules: Optional[GitignoreRules]
+):
+    """Yield Python files under `root` via a stack-based `os.scandir` walk.
+
+    Excluded directories are pruned before descent, so whole subtrees such
+    as `.git/` or `.venv/` never get scanned, and the cached `DirEntry`
+    type information avoids per-entry `stat()` calls.
+    """
+    root_str = str(root)
+    stack = [root_str]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except PermissionError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name in exclude:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    # Prune ignored directories up front; per gitignore
+                    # semantics nothing inside an ignored directory can be
+                    # re-included, so the whole subtree is skippable. The
+                    # trailing slash lets `dir/`-style patterns match.
+                    if gitignore_rules and gitignore_rules.is_ignored_str(
+                        os.path.relpath(entry.path, root_str) + "/"
+                    ):
+                        continue
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and entry.name.endswith(
+                    ".py"
+                ):
+                    rel_str = os.path.relpath(entry.path, root_str)
+                    # Check hierarchical .gitignore rules
+                    if gitignore_rules and gitignore_rules.is_ignored_str(rel_str):
+                        continue
+                    yield Path(entry.path)
+
+
 def find_python_files(
     root: Path, exclude: Set[str], gitignore_rules: Optional[GitignoreRules] = None
 ) -> List[Path]:
     """Locate all Python files under `root` while skipping excluded components."""
-    files = []
-    for path in root.rglob("*.py"):
-        rel_parts = path.relative_to(root).parts
-        if any(part in exclude for part in rel_parts):
-            continue
-        # Check hierarchical .gitignore rules
-        if gitignore_rules and gitignore_rules.is_ignored(path):
-            continue
-        files.append(path)
-    return sorted(files)
+    files = list(_scandir_py(root, exclude, gitignore_rules))
+    files.sort()
+    return files
 
 
 def load_gitignore_excludes(root: Path) -> Set[str]:
     gitignore = root / ".gitignore"
     if not gitignore.exists():
         return set()
-    excludes: Set[str] = set()
-    for line in gitignore.read_text(encoding="utf-8").splitlines():
-        entry = line.strip()
-        if not entry or entry.startswith("#") or entry.startswith("!"):
-            continue
-        first = entry.split("/", 1)[0]
-        if not first or any(char in first for char in _GITIGNORE_META):
-            continue
-        excludes.add(first.rstrip("/"))
-    return excludes
+    return _parse_simple_excludes(gitignore.read_text(encoding="utf-8").splitlines())
 
 
 def build_exclude_set(
@@ -216,7 +417,10 @@ def build_exclude_set(
     """Build exclude set and create GitignoreRules for hierarchical ignores."""
     exclude = set(extra)
     exclude.update(DEFAULT_EXCLUDE)
-    # Load hierarchical .gitignore rules
+    # Load hierarchical .gitignore rules. Gitignored directories are
+    # pruned during traversal by the rules themselves; the exclude set
+    # stays name-based so patterns like `docs/*.tmp` cannot blanket-drop
+    # a directory that git only partially ignores.
     gitignore_rules = GitignoreRules(root)
     return exclude, gitignore_rules
 
@@ -226,12 +430,24 @@ def generate_repo_report(
 ) -> RepoMapReport:
     """Assemble a `RepoMapReport` for downstream consumers."""
     python_files = find_python_files(root, exclude, gitignore_rules)
-    dir_imports, http_usage = aggregate_imports(root, python_files)
+    facts = _parse_files(python_files)
+    dir_imports: Dict[str, List[str]] = {}
+    http_usage: Dict[str, List[str]] = {lib: [] for lib in HTTP_LIBS}
     url_report: Dict[str, List[Tuple[int, str]]] = {}
-    for path in python_files:
-        urls = collect_urls(path)
+    # All paths share the root prefix, so relative paths are a single
+    # string slice instead of a Path.relative_to call per file.
+    prefix = _root_prefix(root)
+    for path, (imports, http_libs, urls) in zip(python_files, facts):
+        rel_str = _relative_str(str(path), root, prefix)
+        if imports:
+            key = rel_str.rpartition(os.sep)[0] or "."
+            bucket = dir_imports.setdefault(key, [])
+            for name in imports:
+                _insort_unique(bucket, name)
+            for lib in http_libs:
+                _insort_unique(http_usage.setdefault(lib, []), rel_str)
         if urls:
-            url_report[str(path.relative_to(root))] = urls
+            url_report[rel_str] = urls
     return RepoMapReport(
         top_dirs=gather_top_level_dirs(root, exclude),
         imports_by_dir=dir_imports,
@@ -240,43 +456,48 @@ def generate_repo_report(
     )
 
 
-def render_repo_map(report: RepoMapReport, exclude: Set[str]) -> List[str]:
-    """Turn a report into the markdown lines used for `repo_map.md`."""
-    lines: List[str] = [
-        "# Repository Map",
-        "",
-        f"## Top-level directories (excludes: {', '.join(sorted(exclude)) or '<none>'})",
-        "",
-    ]
+@lru_cache(maxsize=32)
+def _format_excludes(exclude: FrozenSet[str]) -> str:
+    """Render an exclude set as a stable comma-separated string."""
+    return ", ".join(sorted(exclude)) or "<none>"
+
+
+def render_repo_map(report: RepoMapReport, exclude: Set[str]) -> str:
+    """Turn a report into the markdown text used for `repo_map.md`."""
+    buffer = io.StringIO()
+    write = buffer.write
+    write("# Repository Map\n\n")
+    write(f"## Top-level directories (excludes: {_format_excludes(frozenset(exclude))})\n\n")
     if report.top_dirs:
         for name in report.top_dirs:
-            lines.append(f"- {name}/")
+            write(f"- {name}/\n")
     else:
-        lines.append("- None besides excluded entries.")
-    lines.extend(["", "## Imports by directory", ""])
+        write("- None besides excluded entries.\n")
+    write("\n## Imports by directory\n\n")
     if report.imports_by_dir:
         for directory in sorted(report.imports_by_dir):
-            imports = sorted(report.imports_by_dir[directory])
-            lines.append(f"- `{directory}`: {', '.join(imports)}")
+            # Buckets are maintained in sorted order at insert time.
+            imports = report.imports_by_dir[directory]
+            write(f"- `{directory}`: {', '.join(imports)}\n")
     else:
-        lines.append("- No imports detected (no Python files parsed).")
-    lines.extend(["", "## HTTP client usage", ""])
+        write("- No imports detected (no Python files parsed).\n")
+    write("\n## HTTP client usage\n\n")
     for lib in sorted(HTTP_LIBS):
         uses = report.http_usage.get(lib, [])
         if uses:
-            lines.append(f"- {lib}: used in {len(uses)} file(s)")
-            for path in sorted(set(uses)):
-                lines.append(f"  - {path}")
+            write(f"- {lib}: used in {len(uses)} file(s)\n")
+            # Usage lists are kept sorted and unique at insert time.
+            for path in uses:
+                write(f"  - {path}\n")
         else:
-            lines.append(f"- {lib}: not imported in repository")
-    lines.extend(["", "## Discovered URL literals", ""])
+            write(f"- {lib}: not imported in repository\n")
+    write("\n## Discovered URL literals\n\n")
     if report.url_report:
         for path in sorted(report.url_report):
-            lines.append(f"- {path}")
+            write(f"- {path}\n")
             for lineno, url in sorted(report.url_report[path]):
                 line_info = f":{lineno}" if lineno else ""
-                lines.append(f"  - {line_info} {url}")
+                write(f"  - {line_info} {url}\n")
     else:
-        lines.append("- None found in parsed Python strings.")
-    lines.append("")
-    return lines
+        write("- None found in parsed Python strings.\n")
+    return buffer.getvalue()
@@ -1,10 +1,12 @@
 """Unit tests for the repomap helpers."""
 
+import os
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 from repomap import build_exclude_set, generate_repo_report
+from repomap.map_generator import collect_file_facts
 
 
 class MapGeneratorTests(unittest.TestCase):
@@ -32,6 +34,24 @@ class MapGeneratorTests(unittest.TestCase):
             self.assertIn("requests", report.imports_by_dir.get(".", set()))
             self.assertTrue(report.url_report)
 
+    def test_generate_repo_report_with_relative_root(self):
+        """Report keys must stay correct when the root is a relative path."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "kept").mkdir()
+            (root / "kept" / "module.py").write_text(
+                "import os\nURL = 'https://example.com/rel'\n"
+            )
+            cwd = os.getcwd()
+            os.chdir(tmpdir)
+            try:
+                exclude, gitignore_rules = build_exclude_set(Path("."), [])
+                report = generate_repo_report(Path("."), exclude, gitignore_rules)
+            finally:
+                os.chdir(cwd)
+            self.assertIn("kept", report.imports_by_dir)
+            self.assertIn(os.path.join("kept", "module.py"), report.url_report)
+
     def test_hierarchical_gitignore_is_respected(self):
         """Test that subdirectory .gitignore files are respected."""
         with TemporaryDirectory() as tmpdir:
@@ -77,3 +97,99 @@ class MapGeneratorTests(unittest.TestCase):
             imports = report.imports_by_dir.get("subdir", set())
             self.assertNotIn("os", imports)  # from ignored.py
             self.assertIn("sys", imports)  # from kept.py
+
+    def test_partial_gitignore_pattern_keeps_directory_contents(self):
+        """A root pattern like docs/*.tmp must not exclude docs/ itself."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / ".gitignore").write_text("docs/*.tmp\n")
+            docs = root / "docs"
+            docs.mkdir()
+            (docs / "module.py").write_text("import os\n")
+            (docs / "scratch.tmp").write_text("ignored\n")
+
+            exclude, gitignore_rules = build_exclude_set(root, [])
+            report = generate_repo_report(root, exclude, gitignore_rules)
+
+            self.assertIn("docs", report.top_dirs)
+            self.assertIn("docs", report.imports_by_dir)
+            self.assertNotIn("docs", exclude)
+
+    def test_negation_cannot_reinclude_inside_ignored_directory(self):
+        """Per gitignore semantics, files under an ignored directory stay
+        ignored even if a nested .gitignore tries to negate them; the
+        traversal relies on this to prune whole subtrees."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / ".gitignore").write_text("sub/\n")
+            subdir = root / "sub"
+            subdir.mkdir()
+            (subdir / ".gitignore").write_text("!kept.py\n")
+            (subdir / "kept.py").write_text("import sys\n")
+
+            exclude, gitignore_rules = build_exclude_set(root, [])
+            report = generate_repo_report(root, exclude, gitignore_rules)
+
+            self.assertNotIn("sub", report.imports_by_dir)
+
+
+class CollectFileFactsTests(unittest.TestCase):
+    def _facts(self, source):
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "module.py"
+            path.write_text(source)
+            return collect_file_facts(path)
+
+    def test_import_forms_yield_root_names(self):
+        imports, http_used, _ = self._facts(
+            "import os.path\n"
+            "import requests as r, json\n"
+            "from aiohttp.web import Application\n"
+            "from . import sibling\n"
+            "from .relmod import thing\n"
+        )
+        self.assertEqual(imports, {"os", "requests", "json", "aiohttp", "relmod"})
+        self.assertEqual(http_used, {"requests", "aiohttp"})
+
+    def test_imports_in_nested_and_compound_statements(self):
+        imports, _, _ = self._facts(
+            "def handler():\n"
+            "    import httpx\n"
+            "x = 1; import json\n"
+            "if True: import base64\n"
+        )
+        self.assertEqual(imports, {"httpx", "json", "base64"})
+
+    def test_non_statement_keyword_positions_are_ignored(self):
+        imports, _, _ = self._facts(
+            "def gen():\n"
+            "    yield from range(3)\n"
+            "values = {'import': 1}\n"
+        )
+        self.assertEqual(imports, set())
+
+    def test_url_literals_with_prefixes_and_comments(self):
+        _, _, urls = self._facts(
+            "URL = 'https://example.com/api'\n"
+            "RAW = b'https://bytes.example/skip'\n"
+            "FMT = f'https://fstr.example/{1}'\n"
+            "# https://comment.example/skip\n"
+        )
+        found = {url for _, url in urls}
+        self.assertIn("https://example.com/api", found)
+        self.assertIn("https://fstr.example/", found)
+        self.assertNotIn("https://bytes.example/skip", found)
+        self.assertEqual(urls[0][0], 1)
+
+    def test_concatenated_url_pieces_are_reported_separately(self):
+        # Known deviation from the AST pass: implicit concatenation is
+        # scanned per literal, so only the leading piece looks like a URL.
+        _, _, urls = self._facts("URL = 'https://exa' 'mple.com/joined'\n")
+        self.assertEqual([url for _, url in urls], ["https://exa"])
+
+    def test_partial_results_survive_a_token_error(self):
+        imports, _, _ = self._facts(
+            "import os\n"
+            "TEXT = '''unterminated\n"
+        )
+        self.assertIn("os", imports)